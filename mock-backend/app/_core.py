@@ -0,0 +1,36 @@
+import numpy as np
+from numba import njit
+
+# explicit signatures compile (or load from cache) at import, so no request pays for it
+
+@njit("f8(f8)", cache=True)
+def _q2(x):
+    # round half up to 2 decimals; inputs are non-negative. Divide rather than
+    # multiply by 0.01 so the result is the double closest to the 2-decimal value
+    return int(x * 100.0 + 0.5) / 100.0
+
+@njit("UniTuple(f8,4)(f8,f8,f8,f8)", cache=True)
+def _student_vals(u0, u1, u2, u3):
+    # focus, stress, engagement, relaxation
+    return (
+        _q2(u0 * 0.55 + 0.4),
+        _q2(u1 * 0.7 + 0.2),
+        _q2(u2 * 0.5 + 0.5),
+        _q2(u3 * 0.6 + 0.3),
+    )
+
+@njit("UniTuple(f8,3)(f8,f8,f8)", cache=True)
+def _instructor_vals(u0, u1, u2):
+    # avg_focus, avg_stress, avg_engagement
+    return (
+        _q2(u0 * 0.4 + 0.5),
+        _q2(u1 * 0.5 + 0.3),
+        _q2(u2 * 0.45 + 0.5),
+    )
+
+@njit("f8[:,::1](f8[:,::1])", cache=True)
+def _student_batch(u):
+    out = np.empty_like(u)
+    for i in range(u.shape[0]):
+        out[i, 0], out[i, 1], out[i, 2], out[i, 3] = _student_vals(u[i, 0], u[i, 1], u[i, 2], u[i, 3])
+    return out
@@ -1,25 +1,77 @@
-import random 
-from fastapi import APIRouter
+import time
+import numpy as np
+from numpy.random import Generator, SFC64
+from fastapi import APIRouter, Query, Response
+from app.schemas import StudentInsightsBatch, InstructorSummary
+from app._core import _student_vals, _student_batch, _instructor_vals
 
 router = APIRouter(prefix="")
 
+# SFC64 is the fastest bundled bit generator; statistical strength doesn't matter for mock data
+_RNG = Generator(SFC64())
+
+_SIGNAL = ("good", "medium", "poor")
+_MODULES = ("module 1", "Module 2", "Module 3", "Module 4")
+
+# the insights payload has a fixed shape, so format it straight into bytes
+_INSIGHTS_TMPL = b'{"focus":%.2f,"stress":%.2f,"engagement":%.2f,"relaxation":%.2f,"signal_quality":"%s"}'
+_SIGNAL_BYTES = tuple(s.encode() for s in _SIGNAL)
+
+
+def _uniform_pool(cols, size=4096):
+    # hand out rows of one big draw so the RNG is only called every `size` requests
+    while True:
+        buf = _RNG.random((size, cols), dtype=np.float32)
+        for row in buf:
+            yield row
+
+# the trailing column picks signal_quality via int(u * 3)
+_student_pool = _uniform_pool(5)
+
 @router.get("/student/insights")
-def student_insights():
+async def student_insights():
+    u0, u1, u2, u3, u_sig = next(_student_pool).tolist()
+    focus, stress, engagement, relaxation = _student_vals(u0, u1, u2, u3)
+    body = _INSIGHTS_TMPL % (focus, stress, engagement, relaxation, _SIGNAL_BYTES[int(u_sig * 3)])
+    return Response(content=body, media_type="application/json")
+
+@router.get("/student/insights/batch")
+async def student_insights_batch(n: int = Query(32, ge=1, le=1000)) -> StudentInsightsBatch:
+    vals = _student_batch(_RNG.random((n, 4))).tolist()
+    sigs = _RNG.integers(0, 3, size=n).tolist()
     return {
-        "focus": round(random.uniform(0.4, 0.95), 2),
-        "stress" : round(random.uniform(0.2,0.9), 2),
-        "engagement": round(random.uniform(0.5, 1.0), 2),
-        "relaxation": round(random.uniform(0.3, 0.9), 2),
-        "signal_quality": random.choice(["good","medium","poor"]),
+        "items": [
+            {
+                "focus": f,
+                "stress": s,
+                "engagement": e,
+                "relaxation": r,
+                "signal_quality": _SIGNAL[q],
+            }
+            for (f, s, e, r), q in zip(vals, sigs)
+        ],
     }
 
+# the summary is class-wide, so it is only redrawn once per window. Seeding the draw
+# with the window number keeps every uvicorn worker serving the same payload
+_SUMMARY_TTL = 5
+_summary = (None, None)
+
 @router.get("/instructor/summary")
-def instructor_summary():
-    return {
-        "module": random.choice(["module 1", "Module 2", "Module 3", "Module 4"]),
-        "avg_focus": round(random.uniform(0.5,0.9), 2),
-        "avg_stress": round(random.uniform(0.3,0.8), 2),
-        "avg_engagement": round(random.uniform(0.5,0.95), 2),
-        "students_high_stress": random.randint(5,25),
+async def instructor_summary() -> InstructorSummary:
+    global _summary
+    window = int(time.time() // _SUMMARY_TTL)
+    if _summary[0] == window:
+        return _summary[1]
+    u0, u1, u2, u_mod, u_high = Generator(SFC64(window)).random(5).tolist()
+    avg_focus, avg_stress, avg_engagement = _instructor_vals(u0, u1, u2)
+    payload = {
+        "module": _MODULES[int(u_mod * 4)],
+        "avg_focus": avg_focus,
+        "avg_stress": avg_stress,
+        "avg_engagement": avg_engagement,
+        "students_high_stress": 5 + int(u_high * 21),
         "students_total": 30,
-    }
\ No newline at end of file
+    }
+    _summary = (window, payload)
+    return payload
\ No newline at end of file
@@ -0,0 +1,21 @@
+from typing import Literal
+from pydantic import BaseModel
+
+
+class StudentInsights(BaseModel):
+    focus: float
+    stress: float
+    engagement: float
+    relaxation: float
+    signal_quality: Literal["good", "medium", "poor"]
+
+class StudentInsightsBatch(BaseModel):
+    items: list[StudentInsights]
+
+class InstructorSummary(BaseModel):
+    module: str
+    avg_focus: float
+    avg_stress: float
+    avg_engagement: float
+    students_high_stress: int
+    students_total: int
@@ -1,19 +1,34 @@
-from fastapi import FastAPI
+import os
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
 from app.routes import router
 
 
-app = FastAPI(title="Mock Classroom Wellbeig API")
+DEV = os.getenv("APP_ENV", "dev") == "dev"
 
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins = ["*"],
-    allow_methods = ["*"],
-    allow_headers = ["*"],
-)
+# the OpenAPI schema and docs UI are only useful while developing
+docs = {} if DEV else {"docs_url": None, "redoc_url": None, "openapi_url": None}
+
+app = FastAPI(title="Mock Classroom Wellbeig API", **docs)
+
+# outside dev the reverse proxy adds Access-Control-Allow-Origin, so skip the per-request CORS work
+if DEV:
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins = ["*"],
+        allow_methods = ["*"],
+        allow_headers = ["*"],
+    )
+
+_HEALTH_BYTES = b'{"status":"ok"}'
 
 @app.get("/health")
-def health():
-    return {"status": "ok"}
+async def health():
+    return Response(content=_HEALTH_BYTES, media_type="application/json")
+
+app.include_router(router)
 
-app.include_router(router)
\ No newline at end of file
+if __name__ == "__main__":
+    import uvicorn
+    # uvloop + httptools keep event-loop and HTTP parsing overhead low for the async endpoints
+    uvicorn.run("main:app", port=8765, loop="uvloop", http="httptools", workers=os.cpu_count())